@@ -1,20 +1,38 @@
 """Base agent with OpenAI + Gemini support and multi-round discussion."""
 import json
+import threading
 from openai import OpenAI
 from aibrief import config
 
 _openai = OpenAI(api_key=config.OPENAI_API_KEY)
 _gemini = None
+_gemini_lock = threading.Lock()
 
 
 def _get_gemini():
+    """Process-wide Gemini client, shared by agents, NewsScout, WorldPulse
+    and Imagen visuals so they reuse one HTTP connection pool.
+
+    Locked because the first call can come from the visual/persona pools.
+    """
     global _gemini
-    if _gemini is None:
-        from google import genai
-        _gemini = genai.Client(api_key=config.GEMINI_API_KEY)
+    with _gemini_lock:
+        if _gemini is None:
+            from google import genai
+            _gemini = genai.Client(api_key=config.GEMINI_API_KEY)
     return _gemini
 
 
+def _context_json(context: dict) -> str:
+    """Serialise agent context for the prompt, capped at 15k chars.
+
+    Compact separators and raw UTF-8: indentation and \\u escapes are
+    pure token overhead for the model, and they ate into the cap.
+    """
+    return json.dumps(context, separators=(",", ":"), ensure_ascii=False,
+                      default=str)[:15000]
+
+
 class Agent:
     def __init__(self, name: str, role: str, system_prompt: str, model: str = None):
         self.name = name
@@ -50,7 +68,7 @@ class Agent:
             messages.append(m)
         user = f"TASK: {task}"
         if context:
-            user += f"\n\nCONTEXT:\n{json.dumps(context, indent=2, default=str)[:15000]}"
+            user += f"\n\nCONTEXT:\n{_context_json(context)}"
         messages.append({"role": "user", "content": user})
 
         kw = dict(model=self.model if not self._is_gemini else "gpt-4o",
@@ -82,7 +100,7 @@ class Agent:
 
         user = f"TASK: {task}"
         if context:
-            user += f"\n\nCONTEXT:\n{json.dumps(context, indent=2, default=str)[:15000]}"
+            user += f"\n\nCONTEXT:\n{_context_json(context)}"
         mem = ""
         for m in self.memory[-6:]:
             mem += f"\n{m['role'].upper()}: {m['content']}\n"
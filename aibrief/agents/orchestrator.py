@@ -34,6 +34,7 @@ Every phase is TRACED: fixed inputs (from config) and variable inputs
 """
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from aibrief import config
@@ -228,10 +229,8 @@ class AutonomousOrchestrator:
             "run_id": self.tracer.run_id,
             "agent_flow": self.tracer._build_flow_summary(),
             "total_duration": elapsed,
-            "total_agents": len([e for e in self.tracer.entries
-                                 if e.get("phase") != "DEBATE"]),
-            "total_debates": len([e for e in self.tracer.entries
-                                  if e.get("phase") == "DEBATE"]),
+            "total_agents": self.tracer.agent_calls,
+            "total_debates": self.tracer.debates,
             "key_outputs": {
                 "world_mood": pulse.get("mood", "normal"),
                 "content_type": strategy.get("content_type", ""),
@@ -419,11 +418,9 @@ class AutonomousOrchestrator:
 
     def _get_recent_content_types(self) -> list[str]:
         """Get last 3 content types posted from post_log."""
-        log_path = config.BASE_DIR / "post_log.json"
-        if log_path.exists():
-            log = json.loads(log_path.read_text(encoding="utf-8"))
-            return [p.get("content_type", "") for p in log.get("posts", [])[-3:]]
-        return []
+        from aibrief.pipeline.dedup import load_post_log
+        log = load_post_log()
+        return [p.get("content_type", "") for p in log.get("posts", [])[-3:]]
 
     # ═══════════════════════════════════════════════════════════
     #  PHASE 2: TOPIC DISCOVERY + SEMANTIC DEDUP
@@ -632,30 +629,44 @@ class AutonomousOrchestrator:
             (self.sociologist, "social", "economic", "Economist"),
         ]
 
-        for challenger, own_key, target_key, target_name in pairs:
-            challenge = challenger.think(
-                f"You are reading {target_name}'s analysis. Challenge it from "
-                f"YOUR perspective. Point out what they missed, where they're "
-                f"wrong, and what needs deeper analysis. Also acknowledge what "
-                f"they got right.",
-                context={
-                    "your_own_work": perspectives.get(own_key, {}),
-                    f"{target_name}_work": perspectives.get(target_key, {}),
-                },
-            )
-            challenges[f"{challenger.name}\u2192{target_name}"] = challenge
-            summary = str(challenge)[:80]
-            print(f"    {challenger.name} \u2192 {target_name}: {summary}")
-
-        # Each agent incorporates incoming challenges
-        for challenger, own_key, target_key, target_name in pairs:
-            incoming = {k: v for k, v in challenges.items()
-                        if k.endswith(f"\u2192{challenger.name.split()[0]}")}
-            if incoming:
-                perspectives[own_key] = challenger.respond_to_feedback(
-                    perspectives[own_key], {"cross_challenges": incoming})
+        # Every challenger is a different agent (own memory, no tracer
+        # phase), so the four challenges — and then the four revisions —
+        # are independent LLM calls and can run side by side.
+        with ThreadPoolExecutor(max_workers=len(pairs)) as pool:
+            futures = [
+                pool.submit(
+                    challenger.think,
+                    f"You are reading {target_name}'s analysis. Challenge it from "
+                    f"YOUR perspective. Point out what they missed, where they're "
+                    f"wrong, and what needs deeper analysis. Also acknowledge what "
+                    f"they got right.",
+                    context={
+                        "your_own_work": perspectives.get(own_key, {}),
+                        f"{target_name}_work": perspectives.get(target_key, {}),
+                    },
+                )
+                for challenger, own_key, target_key, target_name in pairs
+            ]
+            for (challenger, _, _, target_name), fut in zip(pairs, futures):
+                challenge = fut.result()
+                challenges[f"{challenger.name}\u2192{target_name}"] = challenge
+                summary = str(challenge)[:80]
+                print(f"    {challenger.name} \u2192 {target_name}: {summary}")
+
+            # Each agent incorporates incoming challenges
+            revisions = []
+            for challenger, own_key, target_key, target_name in pairs:
+                incoming = {k: v for k, v in challenges.items()
+                            if k.endswith(f"\u2192{challenger.name.split()[0]}")}
+                if incoming:
+                    revisions.append((challenger, own_key, len(incoming),
+                                      pool.submit(challenger.respond_to_feedback,
+                                                  perspectives[own_key],
+                                                  {"cross_challenges": incoming})))
+            for challenger, own_key, n_incoming, fut in revisions:
+                perspectives[own_key] = fut.result()
                 print(f"    {challenger.name} incorporated "
-                      f"{len(incoming)} challenge(s)")
+                      f"{n_incoming} challenge(s)")
 
         self.tracer.log_debate("RoundTable (all analysts)", [
             {
@@ -989,10 +1000,9 @@ class AutonomousOrchestrator:
         print(f"  PHASE 8.7: PRE-VISUAL VALIDATION — content gate (Sentinel-A)")
         print("=" * 65)
 
-        debates = [e for e in self.tracer.entries if e.get("phase") == "DEBATE"]
         agent_rounds = {
             d["pair"]: {"rounds": d.get("total_rounds", 0)}
-            for d in debates
+            for d in self.tracer.debate_entries
         }
 
         self.tracer.begin_phase(
@@ -1147,12 +1157,8 @@ class AutonomousOrchestrator:
     def _log_post(self, story, brief, li_post, li_result, design,
                   pdf_path: str = ""):
         """Log post details to post_log.json — stores everything for repost."""
-        log_path = config.BASE_DIR / "post_log.json"
-        if log_path.exists():
-            log = json.loads(log_path.read_text(encoding="utf-8"))
-        else:
-            log = {"posts": [], "topics_covered": [], "embeddings": [],
-                   "total_posts": 0}
+        from aibrief.pipeline.dedup import load_post_log, save_post_log
+        log = load_post_log()
 
         import time as _time
         log["posts"].append({
@@ -1191,8 +1197,7 @@ class AutonomousOrchestrator:
         log["topics_covered"].append(story.get("headline", "?"))
         log["total_posts"] = len(log["posts"])
 
-        log_path.write_text(
-            json.dumps(log, indent=2, ensure_ascii=False), encoding="utf-8")
+        save_post_log(log, durable=True)
 
     # ═══════════════════════════════════════════════════════════
     #  MAIN RUN
@@ -1351,11 +1356,7 @@ class AutonomousOrchestrator:
 
         # ── Store structured data for meta-analysis ──
         from aibrief.data.run_store import index_run, store_validation
-        debates = [e for e in self.tracer.entries
-                   if e.get("phase") == "DEBATE"]
-        total_debate_rounds = sum(
-            d.get("total_rounds", len(d.get("rounds", [])))
-            for d in debates)
+        total_debate_rounds = self.tracer.debate_rounds
 
         store_validation(
             self.tracer.run_id, pre_val, post_val, combined_score)
@@ -1376,7 +1377,7 @@ class AutonomousOrchestrator:
             discussion_score=discussion.get("engagement_score", 0),
             posted=validation["approved"],
             post_url=li_result.get("url", ""),
-            total_debates=len(debates),
+            total_debates=self.tracer.debates,
             total_rounds=total_debate_rounds,
             total_agents=len(self._get_agents_info()),
             duration_seconds=elapsed,
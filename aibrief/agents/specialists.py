@@ -1,9 +1,66 @@
 """All specialist agents for AI Brief."""
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from aibrief import config
-from aibrief.agents.base import Agent
+from aibrief.agents.base import Agent, _get_gemini
 from aibrief.agents.validators import GUARDRAIL
 
+_http = None
+_http_lock = threading.Lock()
+
+
+def _get_http():
+    """Shared keep-alive session for News Scout URL checks.
+
+    Grounding redirects all go through vertexaisearch.cloud.google.com and
+    candidates are checked concurrently, so pooled connections save a TLS
+    handshake on most requests. Connection errors and gateway errors get
+    two quick retries so one transient blip doesn't drop a good article;
+    Retry-After is ignored to keep a slow site from stalling the scout.
+    The first call comes from the check pool's workers, hence the lock.
+    """
+    global _http
+    with _http_lock:
+        if _http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            session.headers["User-Agent"] = (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            )
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    respect_retry_after_header=False,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http = session
+    return _http
+
+
+# Known category path patterns (any segment matches → category)
+_CATEGORY_WORDS = frozenset({
+    "news", "topic", "topics", "category", "categories", "section",
+    "sections", "tag", "tags", "archive", "archives", "latest",
+    "trending", "popular", "featured", "index", "browse",
+    "computers_math", "markets_and_finance", "artificial_intelligence",
+    "science", "technology", "business", "health", "environment",
+    "politics", "sports", "entertainment", "education",
+})
+
+
 # ═══════════════════════════════════════════════════════════════
 #  NEWS SCOUT — Google Search grounded (real URLs, not hallucinated)
 # ═══════════════════════════════════════════════════════════════
@@ -24,10 +81,9 @@ class NewsScout:
     """
 
     def __init__(self):
-        from google import genai
         self.name = "News Scout"
         self.role = "Finds trending news via Google Search grounding"
-        self._client = genai.Client(api_key=config.GEMINI_API_KEY)
+        self._client = _get_gemini()
 
     @staticmethod
     def _is_category_page(url: str) -> bool:
@@ -50,23 +106,13 @@ class NewsScout:
         if not segments:
             return True
 
-        # Known category path patterns (any segment matches → category)
-        category_words = {
-            "news", "topic", "topics", "category", "categories", "section",
-            "sections", "tag", "tags", "archive", "archives", "latest",
-            "trending", "popular", "featured", "index", "browse",
-            "computers_math", "markets_and_finance", "artificial_intelligence",
-            "science", "technology", "business", "health", "environment",
-            "politics", "sports", "entertainment", "education",
-        }
-
         # If ALL segments are generic category words → category page
-        if all(s.lower().replace("-", "_") in category_words for s in segments):
+        if all(s.lower().replace("-", "_") in _CATEGORY_WORDS for s in segments):
             return True
 
         # If last segment is a category word and has no digits → category
         last = segments[-1].lower().replace("-", "_")
-        if last in category_words:
+        if last in _CATEGORY_WORDS:
             return True
 
         # Short path with no slug characteristics (digits, hyphens, long words)
@@ -79,45 +125,59 @@ class NewsScout:
         return False
 
     @staticmethod
-    def _resolve_grounding_url(redirect_url: str) -> str | None:
-        """Follow a Vertex AI grounding redirect to get the real URL."""
-        import requests
+    def _resolve_grounding_url(redirect_url: str) -> tuple[str | None, bool]:
+        """Follow a Vertex AI grounding redirect to get the real URL.
+
+        Returns (url, loaded): loaded is True when the HEAD that followed
+        the redirects already got a < 400 answer from the article itself,
+        so it needs no separate verification GET.
+        """
         try:
-            resp = requests.head(
-                redirect_url, allow_redirects=True, timeout=10,
-                headers={"User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )},
-            )
+            resp = _get_http().head(
+                redirect_url, allow_redirects=True, timeout=10)
             final = resp.url
             if "404" in final.lower():
-                return None
+                return None, False
             if NewsScout._is_category_page(final):
-                return None
-            return final
+                return None, False
+            return final, resp.status_code < 400
         except Exception:
-            return None
+            return None, False
 
     @staticmethod
     def _verify_url(url: str) -> bool:
         """Check if a URL actually loads (HTTP 200)."""
-        import requests
         try:
-            resp = requests.get(
-                url, timeout=10, allow_redirects=True, stream=True,
-                headers={"User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )},
-            )
+            resp = _get_http().get(
+                url, timeout=10, allow_redirects=True, stream=True)
             resp.close()
             return resp.status_code < 400
         except Exception:
             return False
 
+    @classmethod
+    def _check_candidate(cls, uri: str) -> tuple[str, str | None]:
+        """Resolve + verify one grounding URL.
+
+        Returns (status, url) with status one of "ok", "dead",
+        "category" or "invalid". A redirect whose HEAD already loaded
+        counts as "ok"; sites that reject HEAD still get the GET check.
+        """
+        if "vertexaisearch.cloud.google.com" in uri:
+            resolved, loaded = cls._resolve_grounding_url(uri)
+            if not resolved:
+                return "category", None
+            if loaded:
+                return "ok", resolved
+        elif uri.startswith("http"):
+            # Apply category filter to ALL URLs, not just Vertex redirects
+            if cls._is_category_page(uri):
+                return "category", uri
+            resolved = uri
+        else:
+            return "invalid", None
+        return ("ok" if cls._verify_url(resolved) else "dead"), resolved
+
     def find_story(self, content_type: str, pulse: dict,
                    excluded: list = None) -> dict:
         """Search Google for a real trending news article.
@@ -209,34 +269,33 @@ class NewsScout:
         print(f"    [Grounding] {len(real_urls)} source URLs from Google Search")
 
         # ── Resolve redirect URLs and verify ──
-        # Try ALL grounding URLs, skip category pages, pick first real article
+        # Try ALL grounding URLs, skip category pages, pick first real article.
+        # Each candidate is a network round trip or two, so check them
+        # concurrently and take the first verified one in grounding order.
         verified_url = None
         verified_publisher = None
-        for src in real_urls:
-            uri = src["uri"]
-            resolved = None
-            if "vertexaisearch.cloud.google.com" in uri:
-                resolved = self._resolve_grounding_url(uri)
-                if not resolved:
-                    print(f"    [Skip] {src['title']} → category/index page")
-                    continue
-            elif uri.startswith("http"):
-                # Apply category filter to ALL URLs, not just Vertex redirects
-                if self._is_category_page(uri):
-                    print(f"    [Skip] {src['title']} → category/index page: {uri[:70]}")
-                    continue
-                resolved = uri
-            else:
-                continue
-
-            print(f"    [Redirect] {src['title']} → {resolved[:80]}")
-            if self._verify_url(resolved):
-                verified_url = resolved
-                verified_publisher = src["title"]
-                print(f"    [Verified] ✓ HTTP 200: {resolved[:80]}")
-                break
-            else:
-                print(f"    [Verified] ✗ not accessible")
+        if real_urls:
+            pool = ThreadPoolExecutor(max_workers=min(4, len(real_urls)))
+            futures = [pool.submit(self._check_candidate, src["uri"])
+                       for src in real_urls]
+            try:
+                for src, fut in zip(real_urls, futures):
+                    status, resolved = fut.result()
+                    if status == "category":
+                        print(f"    [Skip] {src['title']} → category/index page"
+                              + (f": {resolved[:70]}" if resolved else ""))
+                        continue
+                    if status == "invalid":
+                        continue
+                    print(f"    [Redirect] {src['title']} → {resolved[:80]}")
+                    if status == "ok":
+                        verified_url = resolved
+                        verified_publisher = src["title"]
+                        print(f"    [Verified] ✓ HTTP 200: {resolved[:80]}")
+                        break
+                    print(f"    [Verified] ✗ not accessible")
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
 
         # ── Parse LLM response (may contain prose + JSON) ──
         import re
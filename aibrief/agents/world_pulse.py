@@ -43,8 +43,8 @@ class WorldPulseScanner:
     """Scans global sentiment. Primary: Gemini + Google Search. Fallback: Gemini only."""
 
     def __init__(self):
-        from google import genai
-        self._client = genai.Client(api_key=config.GEMINI_API_KEY)
+        from aibrief.agents.base import _get_gemini
+        self._client = _get_gemini()
 
     def scan(self) -> dict:
         """Return structured sentiment assessment."""
@@ -21,6 +21,7 @@ import time
 import uuid
 import traceback
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -52,51 +53,54 @@ TRACES_DIR = config.BASE_DIR / "traces"
 VALIDATIONS_DIR = CACHE_DIR / "validations"
 
 
+@lru_cache(maxsize=64)
+def _read_json_at(path: str, mtime_ns: int):
+    """Parse a JSON file; cached per (path, mtime) so edits are picked up."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    """Load a cached-run JSON file, or None if missing/unreadable.
+
+    Callers must treat the result as read-only — it is shared between
+    sessions until the file changes on disk.
+    """
+    try:
+        return _read_json_at(str(path), path.stat().st_mtime_ns)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _runs_by_url(mtime_ns: int) -> dict:
+    """Map news_url -> latest run entry for the current runs_index.json."""
+    index = _read_json_at(str(INDEX_PATH), mtime_ns)
+    return {run.get("news_url"): run for run in index.get("runs", [])}
+
+
 def _find_cached_run(url: str) -> Optional[dict]:
     """Check if this URL was previously processed. Returns the run index entry or None."""
-    if not url or not INDEX_PATH.exists():
+    if not url:
         return None
     try:
-        index = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-        for run in reversed(index.get("runs", [])):
-            if run.get("news_url") == url:
-                return run
-        return None
+        return _runs_by_url(INDEX_PATH.stat().st_mtime_ns).get(url)
     except Exception:
         return None
 
 
 def _load_cached_debates(run_id: str) -> Optional[dict]:
     """Load full debate conversations from a previous run."""
-    path = DEBATES_DIR / f"{run_id}.json"
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-    return None
+    return _read_json(DEBATES_DIR / f"{run_id}.json")
 
 
 def _load_cached_trace(run_id: str) -> Optional[dict]:
     """Load the full trace from a previous run."""
-    path = TRACES_DIR / f"{run_id}.json"
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-    return None
+    return _read_json(TRACES_DIR / f"{run_id}.json")
 
 
 def _load_cached_validations(run_id: str) -> Optional[dict]:
     """Load validation results from a previous run."""
-    path = VALIDATIONS_DIR / f"{run_id}.json"
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-    return None
+    return _read_json(VALIDATIONS_DIR / f"{run_id}.json")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -196,6 +200,9 @@ class StageResultResponse(BaseModel):
 #  CONTENT EXTRACTION — fetch URL, extract text
 # ═══════════════════════════════════════════════════════════════
 
+_MAX_ARTICLE_BYTES = 1024 * 1024
+
+
 def _extract_content_from_url(url: str) -> dict:
     """Fetch a URL and extract article content. Returns a story-like dict."""
     import requests
@@ -204,9 +211,26 @@ def _extract_content_from_url(url: str) -> dict:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        html = resp.text
+        # Stream and stop at a cap: only the <head> metadata and the first
+        # ~3000 chars of body text are used, and some pages are many MB
+        with requests.get(url, headers=headers, timeout=15, stream=True) as resp:
+            resp.raise_for_status()
+            buf = bytearray()
+            truncated = False
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                buf += chunk
+                if len(buf) >= _MAX_ARTICLE_BYTES:
+                    truncated = True
+                    break
+            try:
+                html = buf.decode(resp.encoding or "utf-8", errors="replace")
+            except LookupError:  # unknown charset in Content-Type
+                html = buf.decode("utf-8", errors="replace")
+        if truncated:
+            # The cap can cut a <script>/<style> block in half; the strip
+            # regexes below need the closing tag, so drop the open tail.
+            html = re.sub(r"<(script|style)\b[^>]*>(?:(?!</\1>).)*$", "", html,
+                          flags=re.DOTALL | re.IGNORECASE)
 
         # Basic extraction — title from <title> tag
         title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
@@ -245,7 +269,9 @@ def _extract_content_from_url(url: str) -> dict:
             "publisher": publisher,
             "description": description,
             "article_text": article_text,
+            # Length of the extracted text; a lower bound when truncated
             "content_length": len(text),
+            "truncated": truncated,
         }
     except Exception as e:
         return {
@@ -328,6 +354,7 @@ def run_stage_content_extraction(session: PipelineSession, comments: list[str])
         "description": extracted.get("description", "")[:500],
         "article_text_preview": extracted.get("article_text", "")[:500],
         "content_length": extracted.get("content_length", 0),
+        "truncated": extracted.get("truncated", False),
         "status": "extracted" if not extracted.get("error") else "partial",
         "cached_run_id": session.cached_run_id,
     }
@@ -369,8 +396,8 @@ def run_stage_analyst_pairs(session: PipelineSession, comments: list[str]) -> di
             }
 
     # ── Get FULL debate conversations from tracer (every round, every turn) ──
-    debate_entries = [e for e in session.orch.tracer.entries if e.get("phase") == "DEBATE"
-                      and "RoundTable" not in e.get("pair", "")]
+    debate_entries = [e for e in session.orch.tracer.debate_entries
+                      if "RoundTable" not in e.get("pair", "")]
     full_debates = []
     for d in debate_entries:
         rounds = d.get("rounds", [])
@@ -437,8 +464,8 @@ def run_stage_round_table(session: PipelineSession, comments: list[str]) -> dict
 
     # Extract challenge details from tracer
     challenge_entries = [
-        e for e in session.orch.tracer.entries
-        if e.get("phase") == "DEBATE" and "RoundTable" in e.get("pair", "")
+        e for e in session.orch.tracer.debate_entries
+        if "RoundTable" in e.get("pair", "")
     ]
 
     challenges = []
@@ -972,9 +999,8 @@ def run_analyst_perspective(session_id: str, perspective: str, req: RunStageRequ
             }
 
         # Get full debate data from tracer
-        debate_entries = [e for e in session.orch.tracer.entries
-                         if e.get("phase") == "DEBATE"
-                         and perspective in e.get("label", "").lower()
+        debate_entries = [e for e in session.orch.tracer.debate_entries
+                         if perspective in e.get("label", "").lower()
                          and "RoundTable" not in e.get("pair", "")]
 
         full_debate = None
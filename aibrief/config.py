@@ -67,6 +67,14 @@ MODEL_DESIGN_DNA = "gpt-4o"
 # Phase 8.5: Discussion Potential (engagement analysis — needs reasoning)
 MODEL_DISCUSSION_POTENTIAL = "gpt-4o"
 
+# --- Concurrency ---
+# Parallel Imagen/DALL-E requests when generating page visuals and personas.
+# Keep this small: the image APIs rate-limit per key, not per connection.
+try:
+    VISUAL_WORKERS = max(1, int(_env_nonempty("AIBRIEF_VISUAL_WORKERS") or 4))
+except ValueError:
+    VISUAL_WORKERS = 4  # malformed override must not break every entry point
+
 # --- Paths ---
 BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = BASE_DIR / "output"
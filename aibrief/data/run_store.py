@@ -100,6 +100,12 @@ def _extract_reviewer_feedback(review: dict) -> dict:
     }
 
 
+# Debates document of the run currently being written, with the mtime of
+# our last write: (run_id, mtime_ns, data). Only one run is kept, and it is
+# re-read if the file changed on disk since we wrote it.
+_current_debates: tuple[str, int, dict] | None = None
+
+
 def store_debate(run_id: str, debate: dict):
     """Append a debate to the run's debates file.
 
@@ -109,8 +115,17 @@ def store_debate(run_id: str, debate: dict):
         run_id: The run identifier (e.g., 'run_20260212_102911')
         debate: Structured debate dict with full conversation
     """
+    global _current_debates
     path = DEBATES_DIR / f"{run_id}.json"
-    if path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if (_current_debates is not None and _current_debates[0] == run_id
+            and _current_debates[1] == mtime_ns):
+        data = _current_debates[2]
+    elif mtime_ns is not None:
+        # New run in this process, or the file was edited outside it
         data = json.loads(path.read_text(encoding="utf-8"))
     else:
         data = {"run_id": run_id, "debates": []}
@@ -121,6 +136,7 @@ def store_debate(run_id: str, debate: dict):
         json.dumps(data, indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
+    _current_debates = (run_id, path.stat().st_mtime_ns, data)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -286,17 +286,16 @@ def run_repost():
     # ── Recovery: if post_text is truncated, pull from post_log.json ──
     if not post_text or post_text.endswith("\u2026"):
         print("  [REPOST] Post text missing or truncated — recovering from post_log.json...")
-        log_path = config.BASE_DIR / "post_log.json"
-        if log_path.exists():
-            log = json.loads(log_path.read_text(encoding="utf-8"))
-            for post in reversed(log.get("posts", [])):
-                if post.get("tracer_id") == run_id:
-                    full_text = post.get("post_text", "")
-                    if full_text and len(full_text) > len(post_text or ""):
-                        post_text = full_text
-                        doc_title = doc_title or post.get("document_title", "")
-                        print(f"  [REPOST] Recovered full post text ({len(post_text)} chars)")
-                    break
+        from aibrief.pipeline.dedup import load_post_log
+        log = load_post_log()
+        for post in reversed(log.get("posts", [])):
+            if post.get("tracer_id") == run_id:
+                full_text = post.get("post_text", "")
+                if full_text and len(full_text) > len(post_text or ""):
+                    post_text = full_text
+                    doc_title = doc_title or post.get("document_title", "")
+                    print(f"  [REPOST] Recovered full post text ({len(post_text)} chars)")
+                break
 
     if not post_text:
         print("  ✗ No post text found in any stored data.")
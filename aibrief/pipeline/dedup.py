@@ -7,31 +7,107 @@ This runs IMMEDIATELY after NewsScout finds a story, BEFORE any analysis.
 If the story is too similar to a previous post, the orchestrator must
 ask NewsScout for a different story.
 """
+import hashlib
+import heapq
 import json
 import math
+import os
+import tempfile
 from pathlib import Path
 from openai import OpenAI
 from aibrief import config
 
+try:  # optional: post_log.json carries every embedding vector, orjson is
+    import orjson  # several times faster to parse/serialise than stdlib json
+except ImportError:
+    orjson = None
+
 _openai = OpenAI(api_key=config.OPENAI_API_KEY)
 POST_LOG = config.BASE_DIR / "post_log.json"
 SIMILARITY_THRESHOLD = 0.70  # 70% = duplicate
+REPORT_TOP_MATCHES = 5  # closest stored posts printed per check
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Content-addressed embedding cache: is_duplicate and store_embedding embed
+# the same story text, and retries/backfills re-embed known topics.
+EMBEDDING_CACHE_DIR = config.BASE_DIR / "data" / "embeddings"
+EMBEDDING_BATCH_SIZE = 256  # inputs per embeddings.create call
+# The endpoint also caps tokens per request; ~250k chars keeps a batch of
+# long texts well under it (256 x 8000 chars would not be).
+EMBEDDING_BATCH_MAX_CHARS = 250_000
+
+
+def _embedding_cache_path(text: str) -> Path:
+    key = hashlib.blake2b(f"{EMBEDDING_MODEL}|{text}".encode("utf-8"),
+                          digest_size=16).hexdigest()
+    return EMBEDDING_CACHE_DIR / f"{key}.json"
+
+
+def _embedding_batches(texts: list[str]):
+    """Yield batches bounded by both input count and total characters."""
+    batch, chars = [], 0
+    for text in texts:
+        if batch and (len(batch) >= EMBEDDING_BATCH_SIZE
+                      or chars + len(text) > EMBEDDING_BATCH_MAX_CHARS):
+            yield batch
+            batch, chars = [], 0
+        batch.append(text)
+        chars += len(text)
+    if batch:
+        yield batch
 
 
 def _get_embedding(text: str) -> list[float]:
-    """Get embedding vector from OpenAI text-embedding-3-small."""
-    resp = _openai.embeddings.create(
-        model="text-embedding-3-small",
-        input=text[:8000],  # max input safety
-    )
-    return resp.data[0].embedding
-
-
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
+    """Get embedding vector from OpenAI text-embedding-3-small (disk-cached)."""
+    return _get_embeddings([text])[0]
+
+
+def _get_embeddings(texts: list[str]) -> list[list[float]]:
+    """Embed several texts, sending only cache misses in batched API calls."""
+    texts = [t[:8000] for t in texts]  # max input safety
+    vectors: dict[str, list[float]] = {}
+    missing = []
+    for text in dict.fromkeys(texts):  # unique, in order
+        cache_path = _embedding_cache_path(text)
+        if cache_path.exists():
+            try:
+                vectors[text] = json.loads(
+                    cache_path.read_text(encoding="utf-8"))
+                continue
+            except Exception:
+                pass
+        missing.append(text)
+
+    for batch in _embedding_batches(missing):
+        resp = _openai.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=batch,
+        )
+        for item in resp.data:
+            text = batch[item.index]
+            vectors[text] = item.embedding
+            try:
+                EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                _embedding_cache_path(text).write_text(
+                    json.dumps(item.embedding), encoding="utf-8")
+            except OSError as e:
+                print(f"  [Dedup] Could not cache embedding: {e}")
+    return [vectors[t] for t in texts]
+
+
+def _norm(v: list[float]) -> float:
+    return math.sqrt(sum(x * x for x in v))
+
+
+def _cosine_similarity(a: list[float], b: list[float],
+                       mag_a: float | None = None) -> float:
+    """Compute cosine similarity between two vectors.
+
+    Pass mag_a (the norm of a) when comparing one vector against many.
+    """
     dot = sum(x * y for x, y in zip(a, b))
-    mag_a = math.sqrt(sum(x * x for x in a))
-    mag_b = math.sqrt(sum(x * x for x in b))
+    if mag_a is None:
+        mag_a = _norm(a)
+    mag_b = _norm(b)
     if mag_a == 0 or mag_b == 0:
         return 0.0
     return dot / (mag_a * mag_b)
@@ -56,15 +132,37 @@ def _build_topic_text(story: dict) -> str:
 def load_post_log() -> dict:
     """Load the post log."""
     if POST_LOG.exists():
+        if orjson is not None:
+            return orjson.loads(POST_LOG.read_bytes())
         return json.loads(POST_LOG.read_text(encoding="utf-8"))
     return {"posts": [], "topics_covered": [], "embeddings": [],
             "total_posts": 0}
 
 
-def save_post_log(log: dict):
-    """Save the post log."""
-    POST_LOG.write_text(json.dumps(log, indent=2, ensure_ascii=False),
-                        encoding="utf-8")
+def save_post_log(log: dict, durable: bool = False):
+    """Save the post log.
+
+    Written to a uniquely named temp file and swapped in with os.replace,
+    so a crash mid-write never leaves a truncated log and concurrent
+    writers (API server + scheduled run) never share a temp file. Pass
+    durable=True after a publish to also fsync before the swap.
+    """
+    if orjson is not None:
+        data = orjson.dumps(log, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(log, indent=2, ensure_ascii=False).encode("utf-8")
+    fd, tmp = tempfile.mkstemp(dir=POST_LOG.parent,
+                               prefix=POST_LOG.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, POST_LOG)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 def is_duplicate(story: dict) -> tuple[bool, float, str]:
@@ -82,14 +180,25 @@ def is_duplicate(story: dict) -> tuple[bool, float, str]:
         print("  [Dedup] No previous posts — topic is unique")
         return False, 0.0, ""
 
+    # A headline we have already posted is a duplicate outright — skip the
+    # embedding call and the comparison loop.
+    headline = story.get("headline", "")
+    if headline and any(e.get("topic") == headline
+                        for e in stored_embeddings):
+        print(f"  [Dedup] DUPLICATE DETECTED: headline already posted "
+              f"('{headline[:60]}')")
+        return True, 1.0, headline
+
     # Embed the new story
     new_text = _build_topic_text(story)
     print(f"  [Dedup] Embedding new story: '{story.get('headline', '?')[:60]}...'")
     new_embedding = _get_embedding(new_text)
+    new_norm = _norm(new_embedding)  # same for every comparison
 
     # Compare against all stored embeddings
     max_sim = 0.0
     matched_topic = ""
+    scores = []
 
     for entry in stored_embeddings:
         stored_vec = entry.get("vector", [])
@@ -98,13 +207,20 @@ def is_duplicate(story: dict) -> tuple[bool, float, str]:
         if not stored_vec:
             continue
 
-        sim = _cosine_similarity(new_embedding, stored_vec)
+        sim = _cosine_similarity(new_embedding, stored_vec, new_norm)
 
         if sim > max_sim:
             max_sim = sim
             matched_topic = stored_topic
+        scores.append((sim, stored_topic))
 
+    # One line per stored post grows with the whole post history; only
+    # the closest matches are worth reading.
+    for sim, stored_topic in heapq.nlargest(REPORT_TOP_MATCHES, scores,
+                                            key=lambda t: t[0]):
         print(f"    vs '{stored_topic[:50]}...' → {sim:.1%}")
+    if len(scores) > REPORT_TOP_MATCHES:
+        print(f"    (+{len(scores) - REPORT_TOP_MATCHES} less similar posts)")
 
     is_dup = max_sim >= SIMILARITY_THRESHOLD
 
@@ -137,7 +253,7 @@ def store_embedding(story: dict, post_id: str = ""):
         "vector": embedding,
     })
 
-    save_post_log(log)
+    save_post_log(log, durable=True)
     print(f"  [Dedup] Stored embedding for '{story.get('headline', '?')[:50]}...'")
 
 
@@ -150,10 +266,10 @@ def backfill_embeddings():
     existing = log.get("embeddings", [])
     existing_topics = {e.get("topic", "") for e in existing}
 
-    posts = log.get("posts", [])
-    added = 0
-
-    for post in posts:
+    # Collect every post still missing an embedding, then embed them in
+    # one batched request instead of one API round trip per post.
+    pending = []
+    for post in log.get("posts", []):
         topic = post.get("topic", "")
         if topic and topic not in existing_topics:
             # Build a minimal story dict from the post log
@@ -164,19 +280,22 @@ def backfill_embeddings():
                 "source": "",
                 "key_quote": "",
             }
-            text = _build_topic_text(story)
-            embedding = _get_embedding(text)
-
-            if "embeddings" not in log:
-                log["embeddings"] = []
+            pending.append((post, _build_topic_text(story)))
+            existing_topics.add(topic)
 
+    added = 0
+    if pending:
+        embeddings = _get_embeddings([text for _, text in pending])
+        if "embeddings" not in log:
+            log["embeddings"] = []
+        for (post, _), embedding in zip(pending, embeddings):
+            topic = post.get("topic", "")
             log["embeddings"].append({
                 "topic": topic,
                 "summary": post.get("brief_title", ""),
                 "post_id": post.get("post_id", ""),
                 "vector": embedding,
             })
-            existing_topics.add(topic)
             added += 1
             print(f"  [Dedup] Backfilled: '{topic[:50]}...'")
 
@@ -309,15 +309,24 @@ FONTS = [
 #  FONT REGISTRATION
 # ═══════════════════════════════════════════════════════════════
 
-_registered: set[str] = set()
+# font_id -> (regular_name, bold_name), so each font is resolved once
+_registered: dict[str, tuple[str, str]] = {}
+
+_FONTS_BY_ID = {f["id"]: f for f in FONTS}
+_STYLES_BY_ID = {s["id"]: s for s in STYLES}
+_PALETTES_BY_ID = {p["id"]: p for p in COLOR_PALETTES}
 
 
 def register_font(font_id: str) -> tuple[str, str]:
     """Register a font pair with ReportLab. Returns (regular_name, bold_name)."""
-    cfg = next((f for f in FONTS if f["id"] == font_id), FONTS[0])
+    cfg = _FONTS_BY_ID.get(font_id, FONTS[0])
+    if cfg["id"] not in _registered:
+        _registered[cfg["id"]] = _register_font(cfg)
+    return _registered[cfg["id"]]
+
+
+def _register_font(cfg: dict) -> tuple[str, str]:
     reg, reg_b = cfg["reg"], cfg["reg_bold"]
-    if reg in _registered:
-        return reg, reg_b
     try:
         ttf, ttf_b = cfg["ttf"], cfg["ttf_bold"]
         if Path(ttf).exists():
@@ -326,21 +335,17 @@ def register_font(font_id: str) -> tuple[str, str]:
                 pdfmetrics.registerFont(TTFont(reg_b, ttf_b))
             else:
                 reg_b = reg
-            _registered.add(reg)
             print(f"  [Font] Registered: {cfg['name']}")
             return reg, reg_b
     except Exception as e:
         print(f"  [Font] Could not register {cfg['name']}: {e}")
-    _registered.add(reg)
     fb, fb_b = cfg["fallback"], cfg["fallback_bold"]
     print(f"  [Font] Using fallback: {fb}")
     return fb, fb_b
 
 
 def lookup_style(style_id: str) -> dict:
-    return next((s for s in STYLES if s["id"] == style_id), STYLES[0])
+    return _STYLES_BY_ID.get(style_id, STYLES[0])
 
 def lookup_palette(palette_id: str) -> dict:
-    return next((p for p in COLOR_PALETTES if p["id"] == palette_id),
-                COLOR_PALETTES[0])
-
+    return _PALETTES_BY_ID.get(palette_id, COLOR_PALETTES[0])
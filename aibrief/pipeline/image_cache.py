@@ -19,6 +19,7 @@ Cache strategy:
 import json
 import os
 import shutil
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -39,42 +40,67 @@ for d in [PERSONAS_DIR, BACKGROUNDS_DIR, FOREGROUNDS_DIR,
           COVERS_DIR, INFOGRAPHICS_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
+# Visuals are generated from worker threads; serialise manifest updates
+_manifest_lock = threading.Lock()
+
+# Parsed manifest, kept in memory and mutated in place. Re-read only when
+# the file's mtime differs from the one we last loaded/wrote, i.e. when
+# another process (API server vs. scheduled run) has updated it.
+_manifest: dict | None = None
+_manifest_mtime_ns: int | None = None
+
 
 def _load_manifest() -> dict:
-    if MANIFEST_PATH.exists():
-        try:
-            return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    global _manifest, _manifest_mtime_ns
+    try:
+        mtime_ns = MANIFEST_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if _manifest is None or mtime_ns != _manifest_mtime_ns:
+        _manifest = {}
+        if mtime_ns is not None:
+            try:
+                _manifest = json.loads(
+                    MANIFEST_PATH.read_text(encoding="utf-8"))
+            except Exception:
+                pass
+        _manifest_mtime_ns = mtime_ns
+    return _manifest
 
 
 def _save_manifest(manifest: dict):
+    global _manifest_mtime_ns
     MANIFEST_PATH.write_text(
         json.dumps(manifest, indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
+    _manifest_mtime_ns = MANIFEST_PATH.stat().st_mtime_ns
 
 
 def register_image(category: str, key: str, path: str, **metadata):
     """Register an image in the manifest."""
-    manifest = _load_manifest()
-    if category not in manifest:
-        manifest[category] = {}
-    manifest[category][key] = {
-        "path": str(path),
-        "size_kb": round(os.path.getsize(path) / 1024, 1)
-        if os.path.exists(path) else 0,
-        "created": datetime.now().isoformat(),
-        **metadata,
-    }
-    _save_manifest(manifest)
+    # One stat for both existence and size, done outside the lock
+    try:
+        size_kb = round(os.stat(path).st_size / 1024, 1)
+    except OSError:
+        size_kb = 0
+    with _manifest_lock:
+        manifest = _load_manifest()
+        if category not in manifest:
+            manifest[category] = {}
+        manifest[category][key] = {
+            "path": str(path),
+            "size_kb": size_kb,
+            "created": datetime.now().isoformat(),
+            **metadata,
+        }
+        _save_manifest(manifest)
 
 
 def lookup_image(category: str, key: str) -> str:
     """Look up a cached image. Returns path if exists, empty string if not."""
-    manifest = _load_manifest()
-    entry = manifest.get(category, {}).get(key, {})
+    with _manifest_lock:
+        entry = _load_manifest().get(category, {}).get(key, {})
     path = entry.get("path", "")
     if path and os.path.exists(path):
         return path
@@ -83,7 +109,8 @@ def lookup_image(category: str, key: str) -> str:
 
 def get_cache_stats() -> dict:
     """Get summary statistics of the image cache."""
-    manifest = _load_manifest()
+    with _manifest_lock:
+        manifest = {c: dict(images) for c, images in _load_manifest().items()}
     stats = {}
     for category, images in manifest.items():
         total_kb = 0
@@ -96,14 +123,30 @@ def get_cache_stats() -> dict:
     return stats
 
 
+def _link_or_copy(src: Path, dest: Path):
+    """Hard-link src to dest (no data copy), copying only if linking fails.
+
+    The originals stay in place for the old-path fallbacks in visuals.py,
+    so a link gives both locations without duplicating the bytes.
+    """
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(str(src), str(dest))
+
+
 def migrate_legacy_images():
     """One-time migration: move old flat-directory images to organized subdirectories.
 
     Call once; safe to call multiple times (only moves files that exist in old location).
     """
+    with _manifest_lock:
+        return _migrate_legacy_images(_load_manifest())
+
+
+def _migrate_legacy_images(manifest: dict) -> int:
     moved = 0
     old_dir = VISUALS_DIR
-    manifest = _load_manifest()
 
     # Migrate personas (already in personas/ — just register them)
     for f in PERSONAS_DIR.glob("*.png"):
@@ -121,7 +164,7 @@ def migrate_legacy_images():
     for f in old_dir.glob("bg_theme_*.png"):
         dest = BACKGROUNDS_DIR / f.name
         if not dest.exists():
-            shutil.copy2(str(f), str(dest))
+            _link_or_copy(f, dest)
             moved += 1
         key = f.stem  # e.g., "bg_theme_anime_pop_1"
         if "backgrounds" not in manifest:
@@ -136,7 +179,7 @@ def migrate_legacy_images():
     for f in old_dir.glob("cover_*.png"):
         dest = COVERS_DIR / f.name
         if not dest.exists():
-            shutil.copy2(str(f), str(dest))
+            _link_or_copy(f, dest)
             moved += 1
         key = f.stem
         if "covers" not in manifest:
@@ -151,7 +194,7 @@ def migrate_legacy_images():
     for f in old_dir.glob("fg_*.png"):
         dest = FOREGROUNDS_DIR / f.name
         if not dest.exists():
-            shutil.copy2(str(f), str(dest))
+            _link_or_copy(f, dest)
             moved += 1
         key = f.stem
         if "foregrounds" not in manifest:
@@ -10,10 +10,14 @@ LINKEDIN_ACCESS_TOKEN manually when you see EXPIRED_ACCESS_TOKEN.
 from __future__ import annotations
 
 import json
+import random
 import time
 import threading
 import requests
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from aibrief import config
 
 
@@ -35,6 +39,23 @@ def _persist_linkedin_tokens(updates: dict) -> None:
 
 API = "https://api.linkedin.com/rest"
 
+# One pooled session for the whole post flow (OAuth refresh, init, upload,
+# post) so each call reuses the TLS connection instead of handshaking again.
+# Only connection failures and idempotent reads are retried here; POSTs and
+# the streamed upload body must not be replayed blindly.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    ),
+))
+
 _token_lock = threading.Lock()
 _cached_access_token: str | None = None
 _token_expires_at: float = 0.0
@@ -54,7 +75,7 @@ def _oauth_refresh() -> tuple[str | None, int]:
     if not (cid and csec and refresh):
         return None, 0
 
-    resp = requests.post(
+    resp = _session.post(
         "https://www.linkedin.com/oauth/v2/accessToken",
         data={
             "grant_type": "refresh_token",
@@ -147,17 +168,49 @@ def _headers() -> dict:
     }
 
 
+# A 429 means LinkedIn rejected the call before acting on it, so even a
+# POST can be replayed. Waits follow Retry-After, else 1s, 2s, 4s, 8s plus
+# up to 1s of jitter so parallel callers don't retry in lockstep.
+RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_MAX_WAIT = 60.0
+
+
+def _retry_after_seconds(resp: requests.Response, default: float) -> float:
+    value = resp.headers.get("Retry-After", "")
+    try:
+        wait = float(value)
+    except ValueError:
+        try:
+            wait = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            wait = default
+    return min(max(wait, 0.0), RATE_LIMIT_MAX_WAIT)
+
+
 def _linkedin_request(method: str, url: str, **kwargs) -> requests.Response:
-    """Perform request; on 401 EXPIRED_ACCESS_TOKEN, refresh once and retry."""
+    """Perform request; on 401 EXPIRED_ACCESS_TOKEN, refresh once and retry.
+
+    429 responses are retried up to RATE_LIMIT_RETRIES times.
+    """
     kwargs.setdefault("timeout", 30)
-    for attempt in range(2):
-        hdr = dict(kwargs.pop("headers", {}))
+    hdr = dict(kwargs.pop("headers", {}))
+    refreshed = False
+    throttled = 0
+    while True:
         headers = {**_headers(), **hdr}
-        resp = requests.request(method, url, headers=headers, **kwargs)
-
+        resp = _session.request(method, url, headers=headers, **kwargs)
+
+        if resp.status_code == 429 and throttled < RATE_LIMIT_RETRIES:
+            wait = _retry_after_seconds(
+                resp, default=2.0 ** throttled + random.uniform(0, 1.0))
+            throttled += 1
+            print(f"  [LinkedIn] Rate limited — retrying in {wait:.1f}s "
+                  f"({throttled}/{RATE_LIMIT_RETRIES})")
+            time.sleep(wait)
+            continue
         if resp.status_code != 401:
             return resp
-        if attempt == 1:
+        if refreshed:
             return resp
 
         try:
@@ -171,6 +224,7 @@ def _linkedin_request(method: str, url: str, **kwargs) -> requests.Response:
             print("  [LinkedIn OAuth] Access token rejected — forcing refresh and retry.")
             _invalidate_token_cache()
             get_effective_linkedin_token(force_refresh=True)
+            refreshed = True
             continue
 
         return resp
@@ -213,19 +267,19 @@ def _upload_pdf(pdf_path: str) -> str:
 
     print(f"  [LinkedIn] Document URN: {document_urn}")
 
-    with open(pdf_path, "rb") as f:
-        file_data = f.read()
-
+    # Pass the open file so requests streams it (Content-Length comes from
+    # the file size) instead of holding the whole PDF in memory
     token = get_effective_linkedin_token()
-    upload_resp = requests.put(
-        upload_url,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/octet-stream",
-        },
-        data=file_data,
-        timeout=120,
-    )
+    with open(pdf_path, "rb") as f:
+        upload_resp = _session.put(
+            upload_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/octet-stream",
+            },
+            data=f,
+            timeout=120,
+        )
 
     if upload_resp.status_code not in (200, 201):
         print(f"  [LinkedIn] Upload failed: {upload_resp.status_code}")
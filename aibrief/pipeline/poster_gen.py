@@ -18,10 +18,13 @@ Output structure:
   Section 5 — DEBATES & JUDGMENTS:
     Each debate pair: persona images, round-by-round scores, demands, verdicts
 """
+import hashlib
 import math
 import random
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib.colors import HexColor, Color, white
@@ -67,6 +70,20 @@ def _a(base, alpha: float) -> Color:
 
 
 def _gradient(cv, x, y, w, h, c1, c2, steps=60, horiz=False):
+    # The same full-page gradient backs several pages of a poster; record
+    # the strips once as a form XObject and reference it from each page.
+    key = (x, y, w, h, c1.red, c1.green, c1.blue,
+           c2.red, c2.green, c2.blue, steps, horiz)
+    name = "grad" + hashlib.blake2b(repr(key).encode(),
+                                    digest_size=6).hexdigest()
+    if not cv.hasForm(name):
+        cv.beginForm(name)
+        _gradient_strips(cv, x, y, w, h, c1, c2, steps, horiz)
+        cv.endForm()
+    cv.doForm(name)
+
+
+def _gradient_strips(cv, x, y, w, h, c1, c2, steps, horiz):
     if horiz:
         sw = w / steps
         for i in range(steps):
@@ -87,19 +104,37 @@ def _gradient(cv, x, y, w, h, c1, c2, steps=60, horiz=False):
             cv.rect(x, y + i * sh, w, sh + 1, fill=1, stroke=0)
 
 
+_ALIGN = {"left": TA_LEFT, "center": TA_CENTER, "right": TA_RIGHT}
+
+
+@lru_cache(maxsize=256)
+def _para_style(font, size, leading, alignment, rgba=None) -> ParagraphStyle:
+    """Shared ParagraphStyle per combination. Keyed on the colour's rgba
+    tuple — reportlab Color objects don't hash by value."""
+    style = ParagraphStyle("t", fontName=font, fontSize=size,
+                           leading=leading, alignment=alignment)
+    if rgba is not None:
+        style.textColor = Color(*rgba)
+    return style
+
+
+def _para(txt, font, size, color=None, leading=None,
+          align="left") -> Paragraph:
+    """Build the escaped Paragraph used by _text / _measure_text."""
+    leading = leading or size * 1.25
+    safe = (str(txt).replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;"))
+    style = _para_style(font, size, leading, _ALIGN.get(align, TA_LEFT),
+                        color.rgba() if color is not None else None)
+    return Paragraph(safe, style)
+
+
 def _text(cv, txt, x, y, font, size, color, max_w=None, leading=None,
           align="left") -> float:
     if not txt:
         return y
     max_w = max_w or CW
-    leading = leading or size * 1.25
-    al = {"left": TA_LEFT, "center": TA_CENTER, "right": TA_RIGHT
-          }.get(align, TA_LEFT)
-    safe = (str(txt).replace("&", "&amp;").replace("<", "&lt;")
-            .replace(">", "&gt;"))
-    style = ParagraphStyle("t", fontName=font, fontSize=size,
-                           leading=leading, textColor=color, alignment=al)
-    p = Paragraph(safe, style)
+    p = _para(txt, font, size, color, leading, align)
     pw, ph = p.wrap(max_w, H)
     p.drawOn(cv, x, y - ph)
     return y - ph
@@ -110,20 +145,63 @@ def _measure_text(txt, font, size, max_w=None, leading=None) -> float:
     if not txt:
         return 0
     max_w = max_w or CW
-    leading = leading or size * 1.25
-    safe = (str(txt).replace("&", "&amp;").replace("<", "&lt;")
-            .replace(">", "&gt;"))
-    style = ParagraphStyle("m", fontName=font, fontSize=size, leading=leading)
-    p = Paragraph(safe, style)
+    p = _para(txt, font, size, leading=leading)
     pw, ph = p.wrap(max_w, H)
     return ph
 
 
+# Large opaque PNG art (DALL-E / Gemini / gradient pages) is embedded as
+# JPEG: reportlab passes JPEG data through as-is, while PNG pixels are
+# re-deflated at several MB per full-page image.
+PHOTO_JPEG_QUALITY = 88
+PHOTO_JPEG_MIN_BYTES = 200_000
+
+
+def _pdf_image(path: str) -> str:
+    """Return the file to embed for path (a JPEG copy for big photos)."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return path
+    if (Path(path).suffix.lower() != ".png"
+            or st.st_size < PHOTO_JPEG_MIN_BYTES):
+        return path
+    return _pdf_image_at(path, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _pdf_image_at(path: str, mtime_ns: int) -> str:
+    src = Path(path)
+    jpg = src.parent / "pdf" / f"{src.stem}.jpg"
+    try:
+        from PIL import Image
+        with Image.open(src) as img:
+            # Palette images are the flat charts/cards — keep them lossless.
+            # Anything with real transparency (an alpha channel, or a tRNS
+            # chunk on an L/RGB PNG) needs the PNG's mask.
+            if img.mode not in ("RGB", "RGBA", "L"):
+                return path
+            if "transparency" in img.info:
+                return path
+            if jpg.exists() and jpg.stat().st_mtime_ns >= mtime_ns:
+                return str(jpg)
+            if img.mode == "RGBA":
+                if img.getchannel("A").getextrema()[0] < 255:
+                    return path
+                img = img.convert("RGB")
+            jpg.parent.mkdir(parents=True, exist_ok=True)
+            img.save(jpg, "JPEG", quality=PHOTO_JPEG_QUALITY, optimize=True)
+        return str(jpg)
+    except Exception as e:
+        print(f"  [Poster] JPEG copy failed for {src.name}: {e}")
+        return path
+
+
 def _place_image(cv, img_path: str, x, y, w, h):
     if not img_path or not Path(img_path).exists():
         return
     try:
-        cv.drawImage(img_path, x, y, width=w, height=h,
+        cv.drawImage(_pdf_image(img_path), x, y, width=w, height=h,
                      preserveAspectRatio=True, mask="auto")
     except Exception as e:
         print(f"  [Poster] Image error: {e}")
@@ -139,6 +217,10 @@ def _agent_name() -> str:
 # ═══════════════════════════════════════════════════════════════
 
 def _style_decoration(cv, style_id: str, accent, secondary, page_num: int):
+    # Seeded per style/page so re-rendering the same brief lays out the
+    # same decorations (string seeds are stable across processes). The PDF
+    # bytes still differ per build: creation date and document ID.
+    rng = random.Random(f"{style_id}:{page_num}")
     if style_id == "anime_pop":
         cv.setStrokeColor(_a(accent, 0.12))
         cv.setLineWidth(3)
@@ -164,7 +246,7 @@ def _style_decoration(cv, style_id: str, accent, secondary, page_num: int):
         cv.setStrokeColor(_a(accent, 0.08))
         cv.setLineWidth(2)
         for i in range(8):
-            x1 = random.randint(0, W)
+            x1 = rng.randint(0, W)
             cv.line(x1, H, x1 + 200, 0)
     elif style_id == "art_deco":
         cx = W / 2
@@ -194,10 +276,10 @@ def _style_decoration(cv, style_id: str, accent, secondary, page_num: int):
             cv.line(i, H, i + H, 0)
     elif style_id == "cyberpunk_noir":
         for _ in range(6):
-            bx = random.randint(0, W - 80)
-            by = random.randint(0, H - 15)
+            bx = rng.randint(0, W - 80)
+            by = rng.randint(0, H - 15)
             cv.setFillColor(_a(accent, 0.08))
-            cv.rect(bx, by, random.randint(40, 120), random.randint(3, 10),
+            cv.rect(bx, by, rng.randint(40, 120), rng.randint(3, 10),
                     fill=1, stroke=0)
         cv.setStrokeColor(_a(accent, 0.05))
         cv.setLineWidth(0.5)
@@ -1028,6 +1110,7 @@ def generate_persona_images(force: bool = False) -> dict:
         _json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
 
     persona_paths = {}
+    missing = []
     for codename, prompt in AGENT_PERSONAS.items():
         path = str(PERSONAS_DIR / f"{codename.lower()}.png")
 
@@ -1037,18 +1120,70 @@ def generate_persona_images(force: bool = False) -> dict:
         if Path(path).exists() and Path(path).stat().st_size > 1000:
             persona_paths[codename] = path
             continue
+        missing.append((codename, prompt, path))
 
+    def _generate(codename, prompt, path):
         print(f"  [Persona] Generating {codename}...")
         result = _generate_imagen(prompt, path, aspect="1:1", size="1K")
         if not result:
             result = _generate_dalle(prompt, path, size="1024x1024")
         if result:
-            persona_paths[codename] = path
             print(f"  [Persona] {codename} saved")
         else:
             print(f"  [Persona] {codename} FAILED — will skip image")
+        return result
+
+    # Cold cache means up to 21 image requests; run a few at a time
+    if missing:
+        workers = min(config.VISUAL_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(codename, path, pool.submit(_generate, codename,
+                                                    prompt, path))
+                       for codename, prompt, path in missing]
+            for codename, path, fut in futures:
+                if fut.result():
+                    persona_paths[codename] = path
 
-    return persona_paths
+    # Keep the AGENT_PERSONAS order regardless of completion order
+    return {code: persona_paths[code] for code in AGENT_PERSONAS
+            if code in persona_paths}
+
+
+# Persona portraits are 1024px but never drawn larger than ~70pt; embed a
+# small copy instead so every PDF doesn't carry 21 full-size PNGs.
+PERSONA_THUMB_PX = 256
+
+
+def _persona_thumb(path: str, px: int = PERSONA_THUMB_PX) -> str:
+    """Return a downscaled copy of a persona image (written once on disk)."""
+    try:
+        mtime_ns = Path(path).stat().st_mtime_ns
+    except (OSError, TypeError):
+        return path
+    return _persona_thumb_at(path, mtime_ns, px)
+
+
+@lru_cache(maxsize=64)
+def _persona_thumb_at(path: str, mtime_ns: int, px: int) -> str:
+    # mtime is part of the key so a regenerated portrait (force=True)
+    # gets a fresh thumbnail instead of the cached one
+    src = Path(path)
+    thumb = PERSONAS_DIR / "thumbs" / f"{src.stem}_{px}.png"
+    try:
+        if thumb.exists() and thumb.stat().st_mtime_ns >= mtime_ns:
+            return str(thumb)
+        from PIL import Image
+        from aibrief.pipeline.visuals import PNG_COMPRESS_LEVEL
+        thumb.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(src) as img:
+            if max(img.size) <= px:
+                return path
+            img.thumbnail((px, px), Image.LANCZOS)
+            img.save(thumb, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return str(thumb)
+    except Exception as e:
+        print(f"  [Persona] Thumbnail failed for {src.name}: {e}")
+        return path
 
 
 # Agent codename lookup: from agent name to codename
@@ -1185,17 +1320,6 @@ def _draw_chat_bubble(cv, x, y, w, lines_text, font_name, bold_name,
     ICON_GAP = 8
     TAIL_SIZE = 6
 
-    # Measure content height
-    text_w = w - 2 * BUBBLE_PAD
-    header_h = _measure_text(header, bold_name, 10, max_w=text_w) if header else 0
-    body_h = 0
-    for line in lines_text:
-        body_h += _measure_text(line, font_name, 9, max_w=text_w, leading=12)
-        body_h += 3  # inter-line gap
-
-    total_h = BUBBLE_PAD + header_h + 4 + body_h + BUBBLE_PAD
-    total_h = max(total_h, icon_size + 4)  # at least as tall as icon
-
     # Position bubble and icon
     if is_right:
         bubble_x = x + (W - 2 * M) - w
@@ -1205,7 +1329,27 @@ def _draw_chat_bubble(cv, x, y, w, lines_text, font_name, bold_name,
         bubble_x = x + icon_size + ICON_GAP
         # Adjust width to not overflow
         w = min(w, W - 2 * M - icon_size - ICON_GAP)
-        text_w = w - 2 * BUBBLE_PAD
+    text_w = w - 2 * BUBBLE_PAD
+
+    # Wrap every paragraph once at the final width; the same wrapped
+    # paragraphs are used for measuring and drawing.
+    header_p = None
+    header_h = 0
+    if header:
+        header_p = _para(header, bold_name, 10, header_color, leading=12)
+        header_h = header_p.wrap(text_w, H)[1]
+    body = []
+    body_h = 0
+    for line in lines_text:
+        bp, bh = None, 0
+        if line:
+            bp = _para(line, font_name, 9, body_color, leading=12)
+            bh = bp.wrap(text_w, H)[1]
+        body.append((bp, bh))
+        body_h += bh + 3  # inter-line gap
+
+    total_h = BUBBLE_PAD + header_h + 4 + body_h + BUBBLE_PAD
+    total_h = max(total_h, icon_size + 4)  # at least as tall as icon
 
     bubble_y = y - total_h
 
@@ -1240,15 +1384,16 @@ def _draw_chat_bubble(cv, x, y, w, lines_text, font_name, bold_name,
 
     # Draw header text
     ty = y - BUBBLE_PAD
-    if header:
-        ty = _text(cv, header, bubble_x + BUBBLE_PAD, ty,
-                   bold_name, 10, header_color, max_w=text_w, leading=12)
+    if header_p:
+        ty -= header_h
+        header_p.drawOn(cv, bubble_x + BUBBLE_PAD, ty)
         ty -= 4
 
     # Draw body lines
-    for line in lines_text:
-        ty = _text(cv, line, bubble_x + BUBBLE_PAD, ty,
-                   font_name, 9, body_color, max_w=text_w, leading=12)
+    for bp, bh in body:
+        if bp:
+            ty -= bh
+            bp.drawOn(cv, bubble_x + BUBBLE_PAD, ty)
         ty -= 3
 
     return bubble_y - 8  # gap after bubble
@@ -1670,6 +1815,8 @@ def generate_poster(brief: dict, design: dict, story: dict,
 
     visuals = visuals or {}
     brief["_assistant_name"] = _agent_name()
+    persona_paths = {code: _persona_thumb(path)
+                     for code, path in (persona_paths or {}).items()}
 
     # ── Resolve design from catalog ──
     style_id = design.get("style_id", "luxury_minimalist")
@@ -1765,7 +1912,7 @@ def generate_poster(brief: dict, design: dict, story: dict,
     _build_mind_map(pdf, tracer_flow, topic, font_name, bold_name, colors)
 
     # === DEBATES & JUDGMENTS ===
-    ppaths = persona_paths or {}
+    ppaths = persona_paths
     debate_pages = _build_debates(pdf, tracer_flow, ppaths,
                                   font_name, bold_name, colors)
     judgment_pages = _build_judgments(pdf, tracer_flow, ppaths,
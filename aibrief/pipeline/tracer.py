@@ -33,6 +33,13 @@ class RunTracer:
         self.entries: list[dict] = []
         self.agent_outputs: dict = {}   # agent_name -> latest output
         self._current: dict | None = None
+        # Running totals, kept in step with self.entries
+        self.agent_calls = 0
+        self.debates = 0
+        self.total_tokens = 0
+        self.total_cost_usd = 0.0
+        self.debate_entries: list[dict] = []  # the DEBATE subset of entries
+        self.debate_rounds = 0
 
     # ═══════════════════════════════════════════════════════════════
     #  PUBLIC API
@@ -96,13 +103,16 @@ class RunTracer:
         self.agent_outputs[entry["agent_name"]] = output
 
         self.entries.append(entry)
+        self.agent_calls += 1
+        self.total_tokens += tokens
+        self.total_cost_usd += entry["cost_usd"]
         self._current = None
 
     def log_debate(self, pair_name: str, rounds: list[dict],
                    preparer_name: str = "", reviewer_name: str = "",
                    label: str = ""):
         """Log a preparer/reviewer debate with round-by-round results."""
-        self.entries.append({
+        entry = {
             "phase": "DEBATE",
             "pair": pair_name,
             "preparer_name": preparer_name,
@@ -111,7 +121,11 @@ class RunTracer:
             "total_rounds": len(rounds),
             "rounds": rounds,
             "timestamp": datetime.now().isoformat(),
-        })
+        }
+        self.entries.append(entry)
+        self.debate_entries.append(entry)
+        self.debates += 1
+        self.debate_rounds += len(rounds)
 
     def var_ref(self, source_agent: str, source_codename: str,
                 source_phase: str, value) -> dict:
@@ -134,13 +148,10 @@ class RunTracer:
             "started": datetime.fromtimestamp(self.start_time).isoformat(),
             "completed": datetime.now().isoformat(),
             "total_duration_seconds": round(time.time() - self.start_time, 2),
-            "total_agent_calls": len(
-                [e for e in self.entries if e.get("phase") != "DEBATE"]),
-            "total_debates": len(
-                [e for e in self.entries if e.get("phase") == "DEBATE"]),
-            "total_tokens": sum(e.get("tokens", 0) for e in self.entries),
-            "total_cost_usd": round(
-                sum(e.get("cost_usd", 0) for e in self.entries), 4),
+            "total_agent_calls": self.agent_calls,
+            "total_debates": self.debates,
+            "total_tokens": self.total_tokens,
+            "total_cost_usd": round(self.total_cost_usd, 4),
             "agent_flow": self._build_flow_summary(),
             "phases": self.entries,
             "final_output": self._truncate_value(final_output) if final_output else {},
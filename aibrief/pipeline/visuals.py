@@ -14,6 +14,9 @@ import os
 import random
 import math
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
@@ -23,20 +26,40 @@ from aibrief import config
 #  IMAGEN CLIENT (Google GenAI)
 # ═══════════════════════════════════════════════════════════════
 
-_imagen_client = None
+def _get_imagen():
+    # Same process-wide client the Gemini agents use (one connection pool)
+    from aibrief.agents.base import _get_gemini
+    return _get_gemini()
 
 
-def _get_imagen():
-    global _imagen_client
-    if _imagen_client is None:
-        from google import genai
-        _imagen_client = genai.Client(api_key=config.GEMINI_API_KEY)
-    return _imagen_client
+# DALL-E fallback: one client and one download session, shared by the
+# visual worker threads, so repeat calls reuse pooled keep-alive
+# connections instead of a fresh TLS handshake per image.
+_dalle = None  # (OpenAI client, requests session), created together
+_dalle_lock = threading.Lock()
+
+
+def _get_dalle():
+    global _dalle
+    with _dalle_lock:
+        if _dalle is None:
+            from openai import OpenAI
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_maxsize=max(config.VISUAL_WORKERS, 10)))
+            _dalle = (OpenAI(api_key=config.OPENAI_API_KEY), session)
+    return _dalle
 
 
 VISUALS_DIR = config.OUTPUT_DIR / "visuals"
 VISUALS_DIR.mkdir(exist_ok=True)
 
+# Generated PNGs are decoded and re-deflated by ReportLab when embedded, so
+# Pillow's default level 6 mostly burns CPU; level 1 is several times
+# faster for a somewhat larger file on disk.
+PNG_COMPRESS_LEVEL = 1
+
 # Organized subdirectories
 from aibrief.pipeline.image_cache import (
     BACKGROUNDS_DIR, FOREGROUNDS_DIR, COVERS_DIR, INFOGRAPHICS_DIR,
@@ -48,14 +71,25 @@ from aibrief.pipeline.image_cache import (
 #  HELPERS
 # ═══════════════════════════════════════════════════════════════
 
+_FONT_NAMES = {
+    True: ("arialbd.ttf", "Arial Bold.ttf", "segoeui.ttf"),
+    False: ("arial.ttf", "Arial.ttf", "segoeui.ttf"),
+}
+_font_name_found: dict[bool, str] = {}  # bold -> first name that loaded
+
+
+@lru_cache(maxsize=32)
 def _get_font(size: int, bold: bool = False):
-    names = (["arialbd.ttf", "Arial Bold.ttf", "segoeui.ttf"] if bold
-             else ["arial.ttf", "Arial.ttf", "segoeui.ttf"])
-    for n in names:
+    found = _font_name_found.get(bold)
+    if found:
+        return ImageFont.truetype(found, size)
+    for n in _FONT_NAMES[bold]:
         try:
-            return ImageFont.truetype(n, size)
+            font = ImageFont.truetype(n, size)
         except OSError:
             continue
+        _font_name_found[bold] = n
+        return font
     return ImageFont.load_default()
 
 
@@ -70,6 +104,16 @@ def _lerp_color(c1: tuple, c2: tuple, t: float) -> tuple:
     return tuple(int(a + (b - a) * t) for a, b in zip(c1, c2))
 
 
+def _save_flat_png(img: Image.Image, path: str):
+    """Save flat-colour artwork (cards, timelines) as a palette PNG.
+
+    A few solid colours plus anti-aliased text fit in 256 entries, so this
+    is visually lossless at a fraction of the RGB file size.
+    """
+    img.quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(
+        path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  IMAGEN IMAGE GENERATION
 # ═══════════════════════════════════════════════════════════════
@@ -114,9 +158,9 @@ def _generate_imagen(prompt: str, path: str, aspect: str = "1:1",
 
 def _generate_dalle(prompt: str, path: str, size: str = "1024x1024") -> str:
     """Fallback: generate an image using OpenAI DALL-E 3."""
+    tmp = f"{path}.part"
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client, session = _get_dalle()
         response = client.images.generate(
             model="dall-e-3",
             prompt=prompt,
@@ -125,13 +169,21 @@ def _generate_dalle(prompt: str, path: str, size: str = "1024x1024") -> str:
             quality="standard",
         )
         image_url = response.data[0].url
-        img_data = requests.get(image_url, timeout=30).content
-        with open(path, "wb") as f:
-            f.write(img_data)
-        print(f"  [DALL-E] Saved ({len(img_data) // 1024} KB)")
+        # Stream straight to disk; the .part rename keeps a failed download
+        # from leaving a truncated PNG that later looks like a cache hit.
+        size_b = 0
+        with session.get(image_url, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+                    size_b += len(chunk)
+        os.replace(tmp, path)
+        print(f"  [DALL-E] Saved ({size_b // 1024} KB)")
         return path
     except Exception as e:
         print(f"  [DALL-E] Error: {str(e)[:120]}")
+        Path(tmp).unlink(missing_ok=True)
         return ""
 
 
@@ -289,7 +341,9 @@ def _generate_gradient_art(path: str, design: dict) -> str:
     ac = _hex_to_rgb(design.get("accent_color", "#00d4aa"))
 
     img = Image.new("RGB", (w, h))
-    draw = ImageDraw.Draw(img)
+    # "RGBA" draw mode blends translucent fills straight into the RGB image,
+    # so the glow ellipses need no full-frame overlay or composite.
+    draw = ImageDraw.Draw(img, "RGBA")
 
     for y in range(h):
         t = y / h
@@ -299,14 +353,11 @@ def _generate_gradient_art(path: str, design: dict) -> str:
         cx = random.randint(w // 3, w)
         cy = random.randint(0, h)
         r = random.randint(80, 300)
-        overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        od = ImageDraw.Draw(overlay)
-        od.ellipse([cx - r, cy - r, cx + r, cy + r],
-                   fill=(*ac, random.randint(15, 40)))
-        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
+        draw.ellipse([cx - r, cy - r, cx + r, cy + r],
+                     fill=(*ac, random.randint(15, 40)))
 
     img = img.filter(ImageFilter.GaussianBlur(radius=8))
-    img.save(path, "PNG")
+    img.save(path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
     return path
 
 
@@ -345,7 +396,7 @@ def generate_stat_card(numbers: list[dict], design: dict, run_id: str,
             lx = 20 + (i + 1) * card_w
             draw.line([(lx, 50), (lx, 170)], fill=(*accent, 40), width=1)
 
-    img.save(path, "PNG")
+    _save_flat_png(img, path)
     return path
 
 
@@ -387,7 +438,7 @@ def generate_timeline(events: list[dict], design: dict, run_id: str,
             draw.text((cx - min(tw2, 120) // 2, ly + 35), txt[25:50],
                       fill=(*primary, 180), font=font_ev)
 
-    img.save(path, "PNG")
+    _save_flat_png(img, path)
     return path
 
 
@@ -395,6 +446,64 @@ def generate_timeline(events: list[dict], design: dict, run_id: str,
 #  MAIN: GENERATE ALL VISUALS
 # ═══════════════════════════════════════════════════════════════
 
+def _page_visuals(i: int, page: dict, topic: str, style_id: str,
+                  design: dict, perspectives: dict, run_id: str) -> dict:
+    """Generate the background, foreground and infographic for one page."""
+    visuals = {}
+    ptype = page.get("page_type", "")
+    page_content = (page.get("hero_statement", "") or
+                    page.get("summary_points", "") or
+                    page.get("quote", "") or "AI")
+
+    # Background image — cached by theme (no page content needed)
+    bg = generate_background_image(style_id, str(page_content),
+                                   design, run_id, i + 1)
+    if bg:
+        visuals[f"bg_{i}"] = bg
+
+    # Foreground image — content-aware per page
+    page_title = page.get("page_title", "")
+    points = page.get("points", [])
+    page_key_point = ""
+    if points and isinstance(points, list):
+        first = points[0]
+        if isinstance(first, dict):
+            page_key_point = first.get("point", "")
+        elif isinstance(first, str):
+            page_key_point = first
+    fg = generate_foreground_image(
+        topic, str(page_content), style_id, design, run_id, i + 1,
+        page_title=page_title,
+        page_key_point=page_key_point,
+    )
+    if fg:
+        visuals[f"fg_{i}"] = fg
+
+    # Additional Pillow infographics based on page type
+    if ptype == "stat":
+        econ = perspectives.get("economic", {})
+        stats = [
+            {"value": "$4.2T", "label": "Projected AI Market"},
+            {"value": "40%", "label": "Productivity Gain"},
+            {"value": "2.3M", "label": "New Jobs Created"},
+        ]
+        visuals[f"infographic_{i}"] = generate_stat_card(
+            stats, design, run_id, i)
+    elif ptype == "historical":
+        hist = perspectives.get("historical", {})
+        parallels = hist.get("historical_parallels", [])
+        events = [{"year": p.get("year", "?"), "event": p.get("event", "?")}
+                  for p in parallels[:5]]
+        if not events:
+            events = [{"year": "1997", "event": "Deep Blue beats Kasparov"},
+                      {"year": "2012", "event": "Deep Learning revolution"},
+                      {"year": "2022", "event": "ChatGPT launches"},
+                      {"year": "2026", "event": "Current event"}]
+        visuals[f"infographic_{i}"] = generate_timeline(
+            events, design, run_id, i)
+    return visuals
+
+
 def generate_all_visuals(brief: dict, story: dict, design: dict,
                          perspectives: dict, run_id: str,
                          style_id: str = "") -> dict:
@@ -418,58 +527,18 @@ def generate_all_visuals(brief: dict, story: dict, design: dict,
 
     topic = story.get("headline", "AI")
 
-    for i, page in enumerate(content_pages):
-        ptype = page.get("page_type", "")
-        page_content = (page.get("hero_statement", "") or
-                        page.get("summary_points", "") or
-                        page.get("quote", "") or "AI")
-
-        # Background image — cached by theme (no page content needed)
-        bg = generate_background_image(style_id, str(page_content),
-                                       design, run_id, i + 1)
-        if bg:
-            visuals[f"bg_{i}"] = bg
-
-        # Foreground image — content-aware per page
-        page_title = page.get("page_title", "")
-        points = page.get("points", [])
-        page_key_point = ""
-        if points and isinstance(points, list):
-            first = points[0]
-            if isinstance(first, dict):
-                page_key_point = first.get("point", "")
-            elif isinstance(first, str):
-                page_key_point = first
-        fg = generate_foreground_image(
-            topic, str(page_content), style_id, design, run_id, i + 1,
-            page_title=page_title,
-            page_key_point=page_key_point,
-        )
-        if fg:
-            visuals[f"fg_{i}"] = fg
-
-        # Additional Pillow infographics based on page type
-        if ptype == "stat":
-            econ = perspectives.get("economic", {})
-            stats = [
-                {"value": "$4.2T", "label": "Projected AI Market"},
-                {"value": "40%", "label": "Productivity Gain"},
-                {"value": "2.3M", "label": "New Jobs Created"},
+    # Pages are independent and dominated by network-bound Imagen/DALL-E
+    # calls, so build them concurrently; keys keep the page order.
+    if content_pages:
+        workers = min(config.VISUAL_WORKERS, len(content_pages))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_page_visuals, i, page, topic, style_id,
+                            design, perspectives, run_id)
+                for i, page in enumerate(content_pages)
             ]
-            visuals[f"infographic_{i}"] = generate_stat_card(
-                stats, design, run_id, i)
-        elif ptype == "historical":
-            hist = perspectives.get("historical", {})
-            parallels = hist.get("historical_parallels", [])
-            events = [{"year": p.get("year", "?"), "event": p.get("event", "?")}
-                      for p in parallels[:5]]
-            if not events:
-                events = [{"year": "1997", "event": "Deep Blue beats Kasparov"},
-                          {"year": "2012", "event": "Deep Learning revolution"},
-                          {"year": "2022", "event": "ChatGPT launches"},
-                          {"year": "2026", "event": "Current event"}]
-            visuals[f"infographic_{i}"] = generate_timeline(
-                events, design, run_id, i)
+            for fut in futures:
+                visuals.update(fut.result())
 
     print(f"  [Visuals] Generated {len(visuals)} visual elements "
           f"(Imagen backgrounds + foregrounds + infographics)")
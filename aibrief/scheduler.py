@@ -260,7 +260,8 @@ def install_task():
         f'/f'
     )
 
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    result = subprocess.run(cmd, shell=True, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
     if result.returncode == 0:
         print(f"  Task '{task_name}' installed successfully!")
         print(f"  It will start automatically on next login.")
@@ -277,7 +278,8 @@ def uninstall_task():
     task_name = "AIBrief_AutoPublisher"
     result = subprocess.run(
         f'schtasks /delete /tn "{task_name}" /f',
-        shell=True, capture_output=True, text=True)
+        shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        text=True)
     if result.returncode == 0:
         print(f"  Task '{task_name}' removed.")
     else:
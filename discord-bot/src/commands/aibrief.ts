@@ -1204,6 +1204,7 @@ function storeAgentData(sessionId: string, stageId: string, stageRunId: number,
           publisher: result.publisher,
           description: result.description,
           content_length: result.content_length,
+          truncated: result.truncated,
           article_text_preview: result.article_text_preview,
           cached_run_id: result.cached_run_id,
         }),
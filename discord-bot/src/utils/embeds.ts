@@ -147,7 +147,7 @@ function extractStageFields(
       fields.push(
         { name: "Headline", value: truncate(result.headline, 256) || "?", inline: false },
         { name: "Publisher", value: result.publisher || "?", inline: true },
-        { name: "Content", value: `${result.content_length || 0} chars`, inline: true },
+        { name: "Content", value: `${result.content_length || 0}${result.truncated ? "+" : ""} chars`, inline: true },
         { name: "Status", value: result.status === "extracted" ? "✅ Full extraction" : "Partial", inline: true }
       );
       if (result.description) {
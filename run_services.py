@@ -78,7 +78,8 @@ def _pids_listening_on_port(port: int) -> list[int]:
     # netstat is stable on Windows
     result = subprocess.run(
         ["cmd", "/c", "netstat -ano | findstr LISTENING"],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
         check=False,
     )
@@ -95,15 +96,19 @@ def _pids_listening_on_port(port: int) -> list[int]:
     return sorted(set(pids))
 
 
-def _kill_ports() -> None:
+def _kill_ports() -> bool:
+    """Kill listeners on the service ports. Returns True if any were killed."""
+    killed = False
     for port in (API_PORT, BOT_LOCK_PORT):
         pids = _pids_listening_on_port(port)
         if pids:
             print(f"[cleanup] Port {port} -> killing PIDs: {pids}")
             for pid in pids:
                 _kill_pid(pid)
+            killed = True
         else:
             print(f"[cleanup] Port {port} is free")
+    return killed
 
 
 def _tail(path: Path, lines: int = 12) -> str:
@@ -170,6 +175,42 @@ def _load_pids() -> dict[str, int]:
         return {}
 
 
+def _wait_ports_free(timeout: float = 5.0) -> bool:
+    """Poll until the killed listeners have released their ports.
+
+    Usually done within a few hundred ms; the old fixed 1s wait was both
+    too long in that case and too short for a slow-exiting process.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        if not any(_is_port_listening(p) for p in (API_PORT, BOT_LOCK_PORT)):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+def _wait_until_ready(timeout: float = 60.0) -> tuple[bool, bool]:
+    """Poll API health + bot lock port until both are up or timeout.
+
+    Starts with short sleeps (services that are already warm answer within
+    a fraction of a second) and backs off exponentially to cap polling.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.25
+    api_ok = False
+    bot_ok = False
+    while True:
+        time.sleep(delay)
+        api_ok = api_ok or _http_ok()
+        bot_ok = bot_ok or _is_port_listening(BOT_LOCK_PORT)
+        if (api_ok and bot_ok) or time.monotonic() >= deadline:
+            return api_ok, bot_ok
+        delay = min(delay * 2, 4.0)
+
+
 def cmd_start() -> int:
     if not (ROOT / "aibrief" / "api.py").exists():
         print("[error] aibrief/api.py not found")
@@ -179,8 +220,8 @@ def cmd_start() -> int:
         return 1
 
     print("[start] Cleaning old listeners...")
-    _kill_ports()
-    time.sleep(1)
+    if _kill_ports():
+        _wait_ports_free()
 
     pids: dict[str, int] = {}
 
@@ -207,14 +248,7 @@ def cmd_start() -> int:
         if not PID_FILE.exists():
             _save_pids({})
 
-    api_ok = False
-    bot_ok = False
-    for _ in range(60):
-        time.sleep(1)
-        api_ok = _http_ok()
-        bot_ok = _is_port_listening(BOT_LOCK_PORT)
-        if api_ok and bot_ok:
-            break
+    api_ok, bot_ok = _wait_until_ready()
 
     print("\n[status]")
     print(f"  API health (8900): {'OK' if api_ok else 'NOT READY'}")